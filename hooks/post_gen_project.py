@@ -4,13 +4,13 @@ from pathlib import Path
 
 def remove_dir(path: str) -> None:
     dir_to_remove: Path = Path(path)
-    if dir_to_remove.exists() and dir_to_remove.is_dir():
+    if dir_to_remove.is_dir():
         shutil.rmtree(dir_to_remove)
 
 
 def remove_file(path: str) -> None:
     file_to_remove: Path = Path(path)
-    if file_to_remove.exists() and file_to_remove.is_file():
+    if file_to_remove.is_file():
         file_to_remove.unlink()
 
 
@@ -48,6 +48,7 @@ if __name__ == "__main__":
     if not "{{cookiecutter.DOCKER_IMAGE}}" == "local":
         remove_dir("lambda")
         remove_file("Dockerfile")
+        remove_file(".dockerignore")
 
     if "{{cookiecutter.CONFIG_PATH}}" != "empty":
         remove_dir("configs")
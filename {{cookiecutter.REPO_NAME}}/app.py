@@ -1,8 +1,9 @@
 from aws_cdk import App, Environment
-from config import Config
+from config import Config, get_config
 from lambda_stack import LambdaStack
 
-config: Config = Config(_env_file=".env")
+config: Config = get_config()
+config.validate_config_data()
 
 app: App = App()
 
@@ -1,25 +1,37 @@
 import json
+import os
 from enum import Enum
-from functools import cached_property
+from fnmatch import fnmatch
+from functools import cached_property, lru_cache
 from pathlib import Path
-from typing import List, Optional
+from typing import Dict, List, Optional, Tuple
 
-from pydantic_settings import BaseSettings
+from pydantic_settings import BaseSettings, SettingsConfigDict
 
 
-def read_json_config(path: Path):
-    with open(path, "r") as fh:
-        data: dict = json.load(fh)
-        return data
+def read_json_text(path: Path) -> str:
+    """
+    Returns the content of a JSON file as-is. Raises if it is not valid JSON.
+    """
+    text: str = path.read_text()
+    json.loads(text)
+    return text
 
 
 def get_filenames_of_path(path: Path, ext: str = "*") -> List[Path]:
     """
-    Returns a list of files in a directory/path. Uses pathlib.
+    Returns a sorted list of files in a directory/path. Uses os.scandir.
     """
-    filenames = [file for file in path.glob(ext) if file.is_file()]
-    assert len(filenames) > 0, f"No files found in path: {path}"
-    return filenames
+    with os.scandir(path) as entries:
+        filenames = [
+            Path(entry.path)
+            for entry in entries
+            if entry.is_file() and fnmatch(entry.name, ext)
+        ]
+    if not filenames:
+        raise FileNotFoundError(f"No files found in path: {path}")
+    # sorted, so that the construct ids are created in a stable order
+    return sorted(filenames)
 
 
 class InputType(str, Enum):
@@ -32,6 +44,8 @@ class OutputType(str, Enum):
 
 
 class Config(BaseSettings):
+    model_config = SettingsConfigDict(env_file=".env", frozen=True, extra="ignore")
+
     # AWS Account
     ACCOUNT_ID: str
     REGION: str
@@ -79,28 +93,33 @@ class Config(BaseSettings):
 
     @cached_property
     def input_config_data(self) -> dict:
-        data: dict = read_json_config(self.input_config_path)
-        self.validate_input_config_data()
+        data: dict = json.loads(self.config_contents["input"])
         return data
 
     @cached_property
     def output_config_data(self) -> dict:
-        data: dict = read_json_config(self.output_config_path)
-        self.validate_output_config_data()
+        data: dict = json.loads(self.config_contents["output"])
         return data
 
     @cached_property
     def secrets_config_data(self) -> dict:
-        data: dict = read_json_config(self.secrets_config_path)
-        self.validate_output_config_data()
+        data: dict = json.loads(self.config_contents["secrets"])
         return data
 
     @cached_property
     def transform_config_data(self) -> dict:
-        data: dict = read_json_config(self.transform_config_path)
-        self.validate_transform_config_data()
+        data: dict = json.loads(self.config_contents["transform"])
         return data
 
+    def validate_config_data(self) -> None:
+        """
+        Validates all config files. Kept separate from the cached loading.
+        """
+        self.validate_input_config_data()
+        self.validate_output_config_data()
+        self.validate_secrets_config_data()
+        self.validate_transform_config_data()
+
     def validate_output_config_data(self):
         ...
 
@@ -119,3 +138,50 @@ class Config(BaseSettings):
             path=Path(self.CONFIG_PATH) / "schemas", ext="*.json"
         )
         return files
+
+    @cached_property
+    def docker_image(self) -> Optional[Tuple[str, str]]:
+        """
+        Returns (repository, tag) of DOCKER_IMAGE or None for a local image.
+        """
+        if self.DOCKER_IMAGE == "local":
+            return None
+        parts: List[str] = self.DOCKER_IMAGE.split(":")
+        if len(parts) != 2 or not all(parts):
+            raise ValueError(
+                f"DOCKER_IMAGE must be 'local' or 'repository:tag': {self.DOCKER_IMAGE}"
+            )
+        repository, tag = parts
+        return repository, tag
+
+    @cached_property
+    def config_paths(self) -> List[Path]:
+        return [
+            self.input_config_path,
+            self.output_config_path,
+            self.secrets_config_path,
+            self.transform_config_path,
+        ]
+
+    @cached_property
+    def schema_contents(self) -> Dict[str, str]:
+        """
+        Returns the content of every schema file by name.
+        """
+        return {path.stem: read_json_text(path) for path in self.schema_paths}
+
+    @cached_property
+    def config_contents(self) -> Dict[str, str]:
+        """
+        Returns the content of every config file by name.
+        The *_config_data properties are parsed from it, so each file is read once.
+        """
+        return {path.stem: read_json_text(path) for path in self.config_paths}
+
+
+@lru_cache(maxsize=1)
+def get_config() -> Config:
+    """
+    Returns the (cached) config, so the .env file is parsed only once.
+    """
+    return Config()
@@ -1,3 +1,12 @@
+import logging
+
+# Create expensive objects (e.g. boto3 clients, secrets, env vars) at module scope:
+# they are initialised once per cold start and reused by every warm invocation.
+
+logger: logging.Logger = logging.getLogger()
+logger.setLevel(logging.INFO)
+
+
 def handler(event, context):
-    print("hello world")
+    logger.info("hello world")
     return "my return value"
@@ -1,6 +1,4 @@
-import json
-from pathlib import Path
-from typing import List, Optional
+from typing import Optional
 
 from aws_cdk import Duration, Stack
 from aws_cdk.aws_appconfig import (
@@ -12,6 +10,7 @@ from aws_cdk.aws_appconfig import (
     CfnHostedConfigurationVersion,
 )
 from aws_cdk.aws_ecr import Repository
+from aws_cdk.aws_ecr_assets import Platform
 from aws_cdk.aws_iam import Effect, PolicyStatement, Role, ServicePrincipal
 from aws_cdk.aws_kinesis import IStream, Stream
 from aws_cdk.aws_lambda import (
@@ -21,10 +20,16 @@ from aws_cdk.aws_lambda import (
     StartingPosition,
 )
 from aws_cdk.aws_lambda_event_sources import KinesisEventSource
-from aws_cdk.aws_secretsmanager import ISecret, Secret
-from config import Config, InputType, OutputType, read_json_config
+from config import Config, InputType, OutputType
 from constructs import Construct
 
+# ARN templates of the resources the lambda function is given access to
+_LOGS_ARN: str = "arn:aws:logs:{region}:{account_id}:*"
+_LOG_GROUP_ARN: str = (
+    "arn:aws:logs:{region}:{account_id}:log-group:/aws/lambda/{function_name}"
+)
+_APPCONFIG_ARN: str = "arn:aws:appconfig:*:{account_id}:application/*"
+
 
 class LambdaStack(Stack):
     """
@@ -34,6 +39,7 @@ class LambdaStack(Stack):
     A Docker image (Dockerfile) is built and pushed to a private ECR.
     If the ECR does not exist, it is automatically created.
     Alternatively, an ECR image can be provided.
+    The function runs on arm64 (AWS Graviton), so a provided image must be built for linux/arm64.
 
     The AWS Lambda Function uses AWS AppConfig to retrieve application information.
     For this to work, you either need to add the AWS AppConfig Agent to the Docker image:
@@ -61,10 +67,22 @@ class LambdaStack(Stack):
         self._build()
 
     def _build(self) -> None:
+        config: Config = self.config
+        env_name: str = config.APP_CONFIG_ENV_NAME
+        account_id: str = config.ACCOUNT_ID
+        region: str = config.REGION
+        function_name: str = config.FUNCTION_NAME
+
+        logs_arn: str = _LOGS_ARN.format(region=region, account_id=account_id)
+        log_group_arn: str = _LOG_GROUP_ARN.format(
+            region=region, account_id=account_id, function_name=function_name
+        )
+        appconfig_arn: str = _APPCONFIG_ARN.format(account_id=account_id)
+
         # create new role for the lambda function
         lambda_role: Role = Role(
             self,
-            f"LambdaRole{self.config.APP_CONFIG_ENV_NAME}",
+            f"LambdaRole{env_name}",
             assumed_by=ServicePrincipal("lambda.amazonaws.com"),
         )
 
@@ -73,9 +91,7 @@ class LambdaStack(Stack):
             statement=PolicyStatement(
                 effect=Effect.ALLOW,
                 actions=["logs:CreateLogGroup"],
-                resources=[
-                    f"arn:aws:logs:{self.config.REGION}:{self.config.ACCOUNT_ID}:*"
-                ],
+                resources=[logs_arn],
             )
         )
 
@@ -83,35 +99,33 @@ class LambdaStack(Stack):
             statement=PolicyStatement(
                 effect=Effect.ALLOW,
                 actions=["logs:CreateLogStream", "logs:PutLogEvents"],
-                resources=[
-                    f"arn:aws:logs:{self.config.REGION}:{self.config.ACCOUNT_ID}:log-group:/aws/lambda/{self.config.FUNCTION_NAME}"
-                ],
+                resources=[log_group_arn],
             )
         )
 
         # aws app config application
         self.app_config: CfnApplication = CfnApplication(
             self,
-            f"ApplicationConfig{self.config.APP_CONFIG_ENV_NAME}",
-            name=f"{self.config.APP_CONFIG_NAME}_{self.config.APP_CONFIG_ENV_NAME}",
+            f"ApplicationConfig{env_name}",
+            name=f"{config.APP_CONFIG_NAME}_{env_name}",
         )
 
         # aws app config env
         self.app_env: CfnEnvironment = CfnEnvironment(
             self,
-            f"Environment{self.config.APP_CONFIG_ENV_NAME}",
+            f"Environment{env_name}",
             application_id=self.app_config.attr_application_id,
-            name=f"{self.config.APP_CONFIG_ENV_NAME}",
+            name=env_name,
         )
 
         # aws app config deployment strategy
         self.app_deployment_strategy: CfnDeploymentStrategy = CfnDeploymentStrategy(
             self,
-            f"AppConfigDeploymentStrategy{self.config.APP_CONFIG_ENV_NAME}",
+            f"AppConfigDeploymentStrategy{env_name}",
             deployment_duration_in_minutes=0,
             growth_factor=1.0,
             replicate_to="NONE",
-            name=f"{self.config.APP_CONFIG_DEPLOYMENT_STRATEGY_NAME}_{self.config.APP_CONFIG_ENV_NAME}",
+            name=f"{config.APP_CONFIG_DEPLOYMENT_STRATEGY_NAME}_{env_name}",
         )
 
         lambda_role.add_to_policy(
@@ -124,66 +138,52 @@ class LambdaStack(Stack):
                     "appconfig:StartConfigurationSession",
                 ],
                 resources=[
-                    f"arn:aws:appconfig:*:{self.config.ACCOUNT_ID}:application/*",
+                    appconfig_arn,
                 ],
             )
         )
 
         # for each schema and config, we create & deploy an aws app config profile
 
-        schema_paths: List[Path] = self.config.schema_paths
-
         dep: Optional[CfnDeployment] = None
 
-        for schema_path in schema_paths:
-            dep = self.deploy_app_env(schema_path, dep)
-
-        config_paths: List[Path] = [
-            self.config.input_config_path,
-            self.config.output_config_path,
-            self.config.secrets_config_path,
-            self.config.transform_config_path,
-        ]
+        for name, content in config.schema_contents.items():
+            dep = self.deploy_app_env(name, content, dep)
 
         dep: Optional[CfnDeployment] = None
 
-        for config_path in config_paths:
-            dep = self.deploy_app_env(config_path, dep)
+        for name, content in config.config_contents.items():
+            dep = self.deploy_app_env(name, content, dep)
 
         # allow lambda function SP to retrieve secrets from the secrets manager
-        for secret_name, secret_arn in self.config.secrets_config_data.items():
-            # make sure the secret exists
-            secret_ref: ISecret = Secret.from_secret_complete_arn(  # noqa: F841
-                self, secret_name, secret_complete_arn=secret_arn
-            )
-
+        if config.secrets_config_data:
             lambda_role.add_to_policy(
                 statement=PolicyStatement(
                     effect=Effect.ALLOW,
                     actions=["secretsmanager:GetSecretValue"],
-                    resources=[secret_arn],
+                    resources=list(config.secrets_config_data.values()),
                 )
             )
 
         # Docker
-        if self.config.DOCKER_IMAGE != "local":
-            docker_image_repo, docker_image_tag = self.config.DOCKER_IMAGE.split(":")
+        if config.docker_image is not None:
+            docker_image_repo, docker_image_tag = config.docker_image
 
             code: DockerImageCode = DockerImageCode.from_ecr(
                 repository=Repository.from_repository_name(
                     self,
-                    f"Repository{self.config.APP_CONFIG_ENV_NAME}",
+                    f"Repository{env_name}",
                     repository_name=docker_image_repo,
                 ),
                 tag_or_digest=docker_image_tag,
             )
         else:
-            code: DockerImageCode = DockerImageCode.from_image_asset(directory=".")
+            code: DockerImageCode = DockerImageCode.from_image_asset(
+                directory=".", platform=Platform.LINUX_ARM64
+            )
 
         # environment variables for the lambda function
-        environment: dict = (
-            {} if self.config.FUNCTION_ENV is None else self.config.FUNCTION_ENV
-        )
+        environment: dict = dict(config.FUNCTION_ENV or {})
         environment["app_config_app_name"] = self.app_config.name
         environment["app_config_environment_name"] = self.app_env.name
         environment["app_config_profile_input"] = "input"
@@ -194,26 +194,26 @@ class LambdaStack(Stack):
         # create lambda function with docker image
         lambda_function: DockerImageFunction = DockerImageFunction(
             self,
-            f"LambdaFunction{self.config.APP_CONFIG_ENV_NAME}",
-            function_name=f"{self.config.FUNCTION_NAME}_{self.config.APP_CONFIG_ENV_NAME}",
+            f"LambdaFunction{env_name}",
+            function_name=f"{function_name}_{env_name}",
             code=code,
-            architecture=Architecture.X86_64,
-            description=self.config.FUNCTION_DESCRIPTION,
-            memory_size=self.config.FUNCTION_MEMORY_SIZE,
-            timeout=Duration.seconds(self.config.FUNCTION_TIMEOUT),
-            vpc=self.config.FUNCTION_VPC,
+            architecture=Architecture.ARM_64,
+            description=config.FUNCTION_DESCRIPTION,
+            memory_size=config.FUNCTION_MEMORY_SIZE,
+            timeout=Duration.seconds(config.FUNCTION_TIMEOUT),
+            vpc=config.FUNCTION_VPC,
             environment=environment,
             role=lambda_role,
         )
 
         # INPUT
-        if self.config.INPUT_TYPE == InputType.KINESIS:
-            arn_input: str = self.config.input_config_data["arn"]
+        if config.INPUT_TYPE == InputType.KINESIS:
+            arn_input: str = config.input_config_data["arn"]
 
             # get kinesis reference
             kinesis: IStream = Stream.from_stream_arn(
                 self,
-                f"KinesisInputEventSource{self.config.APP_CONFIG_ENV_NAME}",
+                f"KinesisInputEventSource{env_name}",
                 stream_arn=arn_input,
             )
 
@@ -225,13 +225,13 @@ class LambdaStack(Stack):
             )
 
         # OUTPUT
-        if self.config.OUTPUT_TYPE == OutputType.KINESIS:
-            arn_output: str = self.config.output_config_data["arn"]
+        if config.OUTPUT_TYPE == OutputType.KINESIS:
+            arn_output: str = config.output_config_data["arn"]
 
             # get kinesis reference
             kinesis: IStream = Stream.from_stream_arn(
                 self,
-                f"KinesisOutputEventSource{self.config.APP_CONFIG_ENV_NAME}",
+                f"KinesisOutputEventSource{env_name}",
                 stream_arn=arn_output,
             )
 
@@ -243,37 +243,39 @@ class LambdaStack(Stack):
                     resources=[arn_output],
                 )
             )
-        elif self.config.OUTPUT_TYPE == OutputType.POSTGRESQL:
-            arn_output: str = self.config.output_config_data["arn"]
+        elif config.OUTPUT_TYPE == OutputType.POSTGRESQL:
+            arn_output: str = config.output_config_data["arn"]
 
             # no need to do anything permission-wise
             # if the lambda has the master key of the postgresql database
 
-    def deploy_app_env(self, path, deployment: Optional[CfnDeployment] = None):
-        json_data: dict = read_json_config(path)
+    def deploy_app_env(
+        self, name: str, content: str, deployment: Optional[CfnDeployment] = None
+    ):
+        env_name: str = self.config.APP_CONFIG_ENV_NAME
 
         app_profile: CfnConfigurationProfile = CfnConfigurationProfile(
             self,
-            f"Profile_{self.config.APP_CONFIG_ENV_NAME}_{path.stem}",
+            f"Profile_{env_name}_{name}",
             application_id=self.app_config.attr_application_id,
-            name=path.stem,
+            name=name,
             location_uri="hosted",
         )
 
         hosted_configuration_version: CfnHostedConfigurationVersion = (
             CfnHostedConfigurationVersion(
                 self,
-                f"{self.config.APP_CONFIG_ENV_NAME}_{path.stem}",
+                f"{env_name}_{name}",
                 application_id=self.app_config.attr_application_id,
                 configuration_profile_id=app_profile.attr_configuration_profile_id,
-                content=json.dumps(json_data),
+                content=content,
                 content_type="application/json",
             )
         )
 
         app_deployment: CfnDeployment = CfnDeployment(  # noqa: F841
             self,
-            f"Deployment_{self.config.APP_CONFIG_ENV_NAME}_{path.stem}",
+            f"Deployment_{env_name}_{name}",
             application_id=self.app_config.attr_application_id,
             configuration_profile_id=app_profile.attr_configuration_profile_id,
             configuration_version=hosted_configuration_version.ref,